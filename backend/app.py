@@ -1,6 +1,5 @@
 try:
-    from flask import Flask, jsonify, request
-    from flask_cors import CORS
+    from flask import Flask, Response, jsonify, request
     import requests
 
     FLASK_AVAILABLE = True
@@ -8,10 +7,187 @@ except ImportError:
     FLASK_AVAILABLE = False
     print("Flask not available. Install with: pip install flask flask-cors requests")
 
+try:
+    from flask_cors import CORS
+
+    CORS_AVAILABLE = True
+except ImportError:
+    CORS_AVAILABLE = False
+
+import functools
 import io
 import json
+import logging
+import math
+import multiprocessing
 import os
-from datetime import datetime
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from itertools import chain, repeat
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _stdlib_json_dumps(data):
+    """
+    Serialize data as JSON bytes using the standard library.
+
+    Non-ASCII text is \\u-escaped (as jsonify does), so strings that are not
+    valid UTF-8, such as a lone surrogate, still encode.
+    """
+    return json.dumps(data).encode()
+
+
+def _stdlib_json_dumps_pretty(data):
+    """Serialize data as 2-space indented JSON text using the standard library."""
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching json.JSONDecodeError regardless of which backend is active.
+if ORJSON_AVAILABLE:
+    # orjson reads integers outside the 64-bit range as floats instead of
+    # failing. Any such literal has at least 19 digits in a row, so text with a
+    # 19-digit run is parsed by the standard library, which keeps it exact.
+    # Mapping every digit to "0" and searching for the run both happen in C.
+    _LONG_DIGIT_RUN = {
+        str: (str.maketrans("123456789", "000000000"), "0" * 19),
+        bytes: (bytes.maketrans(b"123456789", b"000000000"), b"0" * 19),
+    }
+
+    def _json_loads_tracked(s):
+        """
+        Parse JSON text (str or bytes) using orjson where it gives the same result.
+
+        Text with very long numbers, and text orjson rejects but the standard
+        library accepts (NaN, Infinity, 1e400), is parsed with json.loads.
+
+        Returns:
+            tuple: The decoded value, and whether json.loads produced it
+        """
+        table, run = _LONG_DIGIT_RUN[type(s)]
+        if run in s.translate(table):
+            return json.loads(s), True
+        try:
+            return orjson.loads(s), False
+        except orjson.JSONDecodeError:
+            return json.loads(s), True
+
+    def _json_loads(s):
+        """Parse JSON text (str or bytes), preferring orjson; see _json_loads_tracked."""
+        return _json_loads_tracked(s)[0]
+
+    def _json_dumps(data):
+        """Serialize data as compact UTF-8 JSON bytes, falling back to the standard library."""
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            return _stdlib_json_dumps(data)
+
+    def _json_dumps_pretty(data):
+        """
+        Serialize data as 2-space indented JSON text, falling back to the standard library.
+
+        orjson refuses integers beyond 64 bits, so those go through json.dumps.
+        It writes NaN and Infinity as null, so data that json.loads parsed
+        should be written with _stdlib_json_dumps_pretty instead.
+        """
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return _stdlib_json_dumps_pretty(data)
+
+else:
+
+    def _json_loads_tracked(s):
+        """Parse JSON text (str or bytes) using the standard library."""
+        return json.loads(s), True
+
+    def _json_loads(s):
+        """Parse JSON text (str or bytes) using the standard library."""
+        return json.loads(s)
+
+    _json_dumps = _stdlib_json_dumps
+    _json_dumps_pretty = _stdlib_json_dumps_pretty
+
+
+# An escaped quote or backslash inside a quote-wrapped layer. Other escapes
+# (\n, \t, \/, \uXXXX) belong to the inner JSON and are left for it to decode.
+_LAYER_ESCAPE = re.compile(r'\\(["\\])')
+
+
+def _parse_malformed(malformed_json_string):
+    """
+    Parses a malformed/double-encoded JSON string into Python objects.
+
+    This is the parsing half of fix_malformed_json. Callers that only need the
+    decoded records (e.g. the SQL endpoints) use it directly and skip the
+    pretty-print and re-parse round trip.
+
+    Args:
+        malformed_json_string (str | bytes): The malformed JSON with excessive
+            escaping. UTF-8 bytes (e.g. a raw HTTP body) are accepted as-is, so
+            callers need not decode them first.
+
+    Returns:
+        The decoded JSON value (usually a list of record dicts)
+
+    Raises:
+        ValueError: If the JSON cannot be parsed or fixed
+    """
+    return _parse_malformed_tracked(malformed_json_string)[0]
+
+
+def _parse_malformed_tracked(malformed_json_string):
+    """Like _parse_malformed, also returning whether json.loads decoded the value."""
+    try:
+        current_string = malformed_json_string.strip()
+
+        # Peel off quote-wrapping layers. Each pass decodes one JSON string
+        # literal with the fast parser, which also undoes that layer's
+        # escaping. Input that is already plain JSON (starts with { or [)
+        # skips the loop entirely.
+        for _ in range(5):  # Prevent infinite loops
+            quote = b'"' if isinstance(current_string, bytes) else '"'
+            if not (current_string.startswith(quote) and current_string.endswith(quote)):
+                break
+            try:
+                current_string, from_stdlib = _json_loads_tracked(current_string)
+            except json.JSONDecodeError:
+                if isinstance(current_string, bytes):
+                    current_string = current_string.decode("utf-8")
+                # Not a valid JSON string literal (e.g. raw newlines inside the
+                # quotes), so repair this layer by hand: drop the outer quotes
+                # and undo the quote/backslash escaping in one left-to-right pass.
+                current_string = _LAYER_ESCAPE.sub(r"\1", current_string[1:-1])
+            if not isinstance(current_string, str):
+                return current_string, from_stdlib
+
+        return _json_loads_tracked(current_string)
+
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unable to parse JSON: {str(e)}")
+    except Exception as e:
+        raise ValueError(f"Error processing JSON: {str(e)}")
+
+
+# Only inputs up to this size are memoized by fix_malformed_json; larger ones
+# would pin several MB of input plus the pretty-printed output in every worker.
+_FIX_CACHE_MAX_INPUT = 256 * 1024
+
 
 def fix_malformed_json(malformed_json_string):
     """
@@ -24,7 +200,7 @@ def fix_malformed_json(malformed_json_string):
     - Multiple layers of quote wrapping
 
     Args:
-        malformed_json_string (str): The malformed JSON string with excessive escaping
+        malformed_json_string (str | bytes): The malformed JSON string with excessive escaping
 
     Returns:
         str: Properly formatted JSON string with 2-space indentation
@@ -32,163 +208,549 @@ def fix_malformed_json(malformed_json_string):
     Raises:
         ValueError: If the JSON cannot be parsed or fixed
     """
-    try:
-        original_string = malformed_json_string.strip()
-        
-        # Handle multiple layers of quote wrapping
-        # Keep removing outer quotes and unescaping until we get valid JSON
-        current_string = original_string
-        max_iterations = 5  # Prevent infinite loops
-        
-        for _ in range(max_iterations):
-            # Handle case where JSON is wrapped in extra quotes
-            if current_string.startswith('"') and current_string.endswith('"'):
-                # Remove outer quotes and unescape
-                current_string = current_string[1:-1].replace('\\"', '"').replace('\\\\', '\\')
-            
-            # Try to parse the current string
-            try:
-                # First parsing attempt
-                first_parse = json.loads(current_string)
-                
-                # If first parse returns a string, parse again (double-encoded)
-                if isinstance(first_parse, str):
-                    data = json.loads(first_parse)
-                else:
-                    data = first_parse
-                
-                # If we get here, parsing succeeded
-                break
-                    
-            except json.JSONDecodeError:
-                # If parsing failed and we haven't modified the string, try direct parsing
-                if current_string == original_string:
-                    # Try direct parsing as last resort
-                    data = json.loads(current_string)
-                    break
-                else:
-                    # Continue the loop to try further unwrapping
-                    continue
-        else:
-            # If we exhausted all iterations, try one final direct parse
-            data = json.loads(current_string)
-
-        # Return properly formatted JSON string
-        return json.dumps(data, indent=2, ensure_ascii=False)
+    if not isinstance(malformed_json_string, (str, bytes)):
+        raise ValueError(
+            "Error processing JSON: expected str or bytes, "
+            f"got {type(malformed_json_string).__name__}"
+        )
+    if len(malformed_json_string) <= _FIX_CACHE_MAX_INPUT:
+        return _fix_malformed_json_cached(malformed_json_string)
+    return _fix_malformed_json(malformed_json_string)
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Unable to parse JSON: {str(e)}")
+
+def _fix_malformed_json(malformed_json_string):
+    """Parse and pretty-print; the uncached body of fix_malformed_json."""
+    data, from_stdlib = _parse_malformed_tracked(malformed_json_string)
+    # Values only json.loads accepts (NaN, Infinity, 1e400) are written back
+    # the same way; orjson would turn them into null.
+    dumps = _stdlib_json_dumps_pretty if from_stdlib else _json_dumps_pretty
+    try:
+        return dumps(data)
     except Exception as e:
         raise ValueError(f"Error processing JSON: {str(e)}")
 
 
-def generate_sql(records, mode, batch_size=500):
+# Small results are memoized so a replayed /api/fix-json request skips the parse
+# and re-serialize. The SQL endpoints call _parse_malformed directly and never
+# go through this cache.
+_fix_malformed_json_cached = functools.lru_cache(maxsize=8)(_fix_malformed_json)
+
+
+@functools.lru_cache(maxsize=1)
+def _today(day_bucket):
+    """Return the current UTC date as YYYY-MM-DD, cached per UTC day bucket."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _utc_today():
+    """Return today's UTC date as YYYY-MM-DD without re-formatting it on every call."""
+    return _today(int(time.time()) // 86400)
+
+
+# Target columns of the crashdata INSERT. "geom" is a generated column in the
+# database and must never be listed here.
+_COLUMNS = (
+    '  "ColliRptNum", "Jurisdiction", "StateOrProvinceName", "RegionName",\n'
+    '  "CountyName", "CityName", "FullDate", "CrashDate", "FullTime",\n'
+    '  "MostSevereInjuryType", "AgeGroup", "InvolvedPersons",\n'
+    '  "Latitude", "Longitude", "Mode"'
+)
+_COLUMN_COUNT = _COLUMNS.count('"') // 2
+_INSERT_PREFIX = f"INSERT INTO crashdata (\n{_COLUMNS}\n) VALUES\n"
+_ON_CONFLICT_SUFFIX = '\nON CONFLICT ("ColliRptNum") DO NOTHING;\n'
+_COPY_PREFIX = f"COPY crashdata (\n{_COLUMNS}\n) FROM STDIN WITH (FORMAT csv);\n"
+_COPY_SUFFIX = "\\.\n"
+
+# Script flavours iter_sql can emit. "copy" loads faster but, unlike the
+# INSERT script, has no ON CONFLICT handling.
+_OUTPUT_FORMATS = ("insert", "copy")
+
+# Translation table for SQL string literals, applied in one pass: single
+# quotes are doubled and NUL characters, which PostgreSQL text cannot store,
+# are dropped. Backslashes are left alone: the output uses plain '...'
+# literals, which are not backslash-escaped under standard_conforming_strings
+# (on by default since PostgreSQL 9.1).
+_SQL_ESCAPES = str.maketrans({"'": "''", "\x00": None})
+
+
+def _sql_str(value):
+    """Wrap a value in single quotes, doubling internal single quotes and dropping NULs. Returns NULL for None."""
+    if value is None:
+        return "NULL"
+    s = value if type(value) is str else str(value)
+    # Most WSDOT text needs no escaping, so skip the translate pass when possible.
+    if "'" in s or "\x00" in s:
+        s = s.translate(_SQL_ESCAPES)
+    return "'" + s + "'"
+
+
+def _sql_num(value):
+    """
+    Return a numeric literal, or NULL for None.
+
+    Floats use repr() (the shortest round-tripping form). NaN/Infinity and
+    values that are not numbers are emitted as NULL rather than spliced into
+    the SQL unquoted.
+    """
+    if value is None:
+        return "NULL"
+    value_type = type(value)
+    if value_type is float:
+        return repr(value) if math.isfinite(value) else "NULL"
+    if value_type is int:
+        return str(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return "NULL"
+    if not math.isfinite(number):
+        return "NULL"
+    return str(int(number)) if number.is_integer() else repr(number)
+
+
+def _map_placeholder(value):
+    """WSDOT uses a bare apostrophe as a placeholder for missing text fields — coerce to NULL."""
+    if value is None or str(value).strip() == "'":
+        return "NULL"
+    return _sql_str(value)
+
+
+def _map_age_group(value):
+    """Empty AgeGroup strings from WSDOT are coerced to NULL."""
+    if value is None or str(value).strip() == "":
+        return "NULL"
+    return _sql_str(value)
+
+
+def _crash_date(full_date):
+    """
+    Extract the date portion (YYYY-MM-DD) from a WSDOT ISO 8601 datetime string.
+
+    The date is parsed with date.fromisoformat so a malformed FullDate becomes
+    NULL instead of failing the whole INSERT on the DATE column. Callers go
+    through a per-batch literal cache, so each distinct FullDate is parsed once.
+    """
+    if not full_date:
+        return "NULL"
+    try:
+        return _sql_str(date.fromisoformat(str(full_date)[:10]).isoformat())
+    except Exception:
+        return "NULL"
+
+
+class _LiteralCache(dict):
+    """
+    Maps raw field values to their formatted SQL literals, formatting each
+    distinct value only once.
+
+    Most WSDOT text columns (Jurisdiction, CountyName, CityName, injury type,
+    dates...) repeat heavily, so a hit is a plain dict lookup instead of a call
+    into the formatter. Entries are keyed on (type, value), so equal values of
+    different types (1, 1.0, True) are formatted separately.
+    """
+
+    __slots__ = ("_format",)
+
+    def __init__(self, format_value):
+        super().__init__()
+        self._format = format_value
+
+    def __missing__(self, key):
+        literal = self[key] = self._format(key[1])
+        return literal
+
+    def column(self, values):
+        """
+        Lazily formats a sequence of values through the cache.
+
+        The (type, value) keys are built by map/zip in C. An unhashable value
+        (e.g. a list) raises TypeError when it is reached; see _row_literals.
+
+        Args:
+            values (list | tuple): The raw values; iterated twice, so not an iterator.
+
+        Returns:
+            iterator: The formatted literal of each value, in order.
+        """
+        return map(self.__getitem__, zip(map(type, values), values))
+
+
+def _column(batch, key):
     """
-    Generates a SQL INSERT script for importing crash records into CrashMap's crashdata table.
+    Returns a lazy iterator over one field of every record in a batch.
 
     Args:
-        records (list): List of dicts parsed from the WSDOT API response.
-        mode (str): The transport mode stamped on every record ('Pedestrian', 'Bicyclist', etc.).
-        batch_size (int): Number of rows per INSERT statement (default 500).
+        batch (list): Record dicts for this batch.
+        key (str): The source field name.
 
     Returns:
-        str: A SQL script with batched INSERT ... ON CONFLICT ("ColliRptNum") DO NOTHING statements.
+        iterator: The field's values in record order (None where missing).
     """
+    return map(dict.get, batch, repeat(key))
 
-    def sql_str(value):
-        """Wrap a value in single quotes, doubling any internal single quotes. Returns NULL for None."""
-        if value is None:
-            return "NULL"
-        return "'" + str(value).replace("'", "''") + "'"
 
-    def sql_num(value):
-        """Return a numeric literal, or NULL for None."""
-        if value is None:
-            return "NULL"
-        return str(value)
+# WSDOT source fields read by the row formatter.
+_SOURCE_FIELDS = (
+    "ColliRptNum", "Jurisdiction", "RegionName", "CountyName", "CityName",
+    "FullDate", "FullTime", "MostSevereInjuryType", "AgeGroup",
+    "InvolvedPersons", "Latitude", "Longitude",
+)
 
-    def map_placeholder(value):
-        """WSDOT uses a bare apostrophe as a placeholder for missing text fields — coerce to NULL."""
-        if value is None or str(value).strip() == "'":
-            return "NULL"
-        return sql_str(value)
-
-    def map_age_group(value):
-        """Empty AgeGroup strings from WSDOT are coerced to NULL."""
-        if value is None or str(value).strip() == "":
-            return "NULL"
-        return sql_str(value)
-
-    def crash_date(full_date):
-        """Extract the date portion (YYYY-MM-DD) from a WSDOT ISO 8601 datetime string."""
-        if not full_date:
-            return "NULL"
-        try:
-            return sql_str(str(full_date)[:10])
-        except Exception:
-            return "NULL"
-
-    def row_values(rec):
-        lat = sql_num(rec.get("Latitude"))
-        lng = sql_num(rec.get("Longitude"))
-        return (
-            f"  ({sql_str(rec.get('ColliRptNum'))}, "
-            f"{sql_str(rec.get('Jurisdiction'))}, "
-            f"'Washington', "
-            f"{map_placeholder(rec.get('RegionName'))}, "
-            f"{sql_str(rec.get('CountyName'))}, "
-            f"{map_placeholder(rec.get('CityName'))}, "
-            f"{sql_str(rec.get('FullDate'))}, "
-            f"{crash_date(rec.get('FullDate'))}, "
-            f"{sql_str(rec.get('FullTime'))}, "
-            f"{sql_str(rec.get('MostSevereInjuryType'))}, "
-            f"{map_age_group(rec.get('AgeGroup'))}, "
-            f"{sql_num(rec.get('InvolvedPersons'))}, "
-            f"{lat}, "
-            f"{lng}, "
-            f"{sql_str(mode)})"
-        )
 
+@dataclass
+class RecordBatch:
+    """
+    Crash records stored column-wise: one list per WSDOT source field.
+
+    generate_sql and iter_sql accept a RecordBatch anywhere they accept a list
+    of record dicts. The formatter then reads each column list directly instead
+    of pulling the field out of every dict, and batches shipped to worker
+    processes pickle each field name once rather than once per record.
+
+    Attributes:
+        columns (dict): Maps each name in _SOURCE_FIELDS to a list of values,
+            all the same length (None where a record lacks the field).
+    """
+
+    columns: dict
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Builds a RecordBatch from a list of record dicts.
+
+        Args:
+            records (list): List of dicts parsed from the WSDOT API response.
+
+        Returns:
+            RecordBatch: The same records, one list per source field.
+        """
+        return cls({key: list(_column(records, key)) for key in _SOURCE_FIELDS})
+
+    def __len__(self):
+        return len(self.columns["ColliRptNum"])
+
+    def __getitem__(self, index):
+        """Slices every column, returning a RecordBatch of those rows."""
+        return RecordBatch({key: values[index] for key, values in self.columns.items()})
+
+
+def _row_literals(batch, mode_literal, cached=True):
+    """
+    Formats every column of one batch as SQL literals.
+
+    This is the per-record hot loop of generate_sql. It works column by column:
+    each output column is a lazy map of one formatter over one source field,
+    and the columns are zipped back into rows, so the per-row iteration runs in
+    C rather than in a Python loop body. Low-cardinality columns go through
+    per-batch literal caches; unique ones (ColliRptNum, InvolvedPersons,
+    Latitude, Longitude) are formatted directly.
+
+    With cached=False every column is formatted directly. Callers use this to
+    retry a batch whose caches hit an unhashable value (a TypeError while
+    consuming the rows).
+
+    Args:
+        batch (list | RecordBatch): Record dicts, or columns, for this batch.
+        mode_literal (str): The already-quoted Mode value stamped on every row.
+        cached (bool): Whether to use the per-batch literal caches (default True).
+
+    Returns:
+        iterator: One tuple of column literals per record, in _COLUMNS order.
+    """
+    if isinstance(batch, RecordBatch):
+        field = batch.columns.__getitem__
+    else:
+
+        def field(key):
+            return list(_column(batch, key))
+
+    if cached:
+        text = _LiteralCache(_sql_str).column
+        placeholder = _LiteralCache(_map_placeholder).column
+        crash_date = _LiteralCache(_crash_date).column
+        age_group = _LiteralCache(_map_age_group).column
+    else:
+        text = functools.partial(map, _sql_str)
+        placeholder = functools.partial(map, _map_placeholder)
+        crash_date = functools.partial(map, _crash_date)
+        age_group = functools.partial(map, _map_age_group)
+    full_dates = field("FullDate")
     columns = (
-        '  "ColliRptNum", "Jurisdiction", "StateOrProvinceName", "RegionName",\n'
-        '  "CountyName", "CityName", "FullDate", "CrashDate", "FullTime",\n'
-        '  "MostSevereInjuryType", "AgeGroup", "InvolvedPersons",\n'
-        '  "Latitude", "Longitude", "Mode"'
+        map(_sql_str, field("ColliRptNum")),
+        text(field("Jurisdiction")),
+        repeat("'Washington'"),
+        placeholder(field("RegionName")),
+        text(field("CountyName")),
+        placeholder(field("CityName")),
+        text(full_dates),
+        crash_date(full_dates),
+        text(field("FullTime")),
+        text(field("MostSevereInjuryType")),
+        age_group(field("AgeGroup")),
+        map(_sql_num, field("InvolvedPersons")),
+        map(_sql_num, field("Latitude")),
+        map(_sql_num, field("Longitude")),
+        repeat(mode_literal),
     )
+    return zip(*columns)
+
+
+def _format_rows(batch, mode_literal):
+    """
+    Formats the VALUES tuples for one INSERT batch.
+
+    Args:
+        batch (list): Record dicts for this batch.
+        mode_literal (str): The already-quoted Mode value stamped on every row.
+
+    Returns:
+        str: Comma/newline separated VALUES tuples, without a trailing newline.
+    """
+    try:
+        rows = list(_row_literals(batch, mode_literal))
+    except TypeError:
+        rows = _row_literals(batch, mode_literal, cached=False)
+    return "  (" + "),\n  (".join(map(", ".join, rows)) + ")"
+
+
+def _copy_field(literal):
+    """
+    Converts a SQL literal into the equivalent COPY CSV field.
+
+    NULL becomes an unquoted empty field (COPY's CSV NULL), strings are
+    re-quoted CSV style so empty strings stay distinct from NULL, and numbers
+    pass through unchanged.
+    """
+    if literal == "NULL":
+        return ""
+    if literal[0] == "'":
+        return '"' + literal[1:-1].replace("''", "'").replace('"', '""') + '"'
+    return literal
+
+
+def _format_copy_rows(batch, mode_literal):
+    """
+    Formats one batch as COPY ... WITH (FORMAT csv) data lines.
+
+    Rows are built from the same literals as the INSERT script, so both formats
+    apply identical NULL coercion and numeric validation.
+
+    Args:
+        batch (list): Record dicts for this batch.
+        mode_literal (str): The already-quoted Mode value stamped on every row.
+
+    Returns:
+        str: Newline separated CSV rows, without a trailing newline.
+    """
+    try:
+        rows = list(_row_literals(batch, mode_literal))
+    except TypeError:
+        rows = _row_literals(batch, mode_literal, cached=False)
+    # Convert every literal of the batch in one flat pass, then regroup by row.
+    fields = iter(list(_LiteralCache(_copy_field).column(list(chain.from_iterable(rows)))))
+    return "\n".join(map(",".join, zip(*[fields] * _COLUMN_COUNT)))
+
+
+# Exports at least this large are formatted across CPU cores. Below it, the cost
+# of shipping records to worker processes outweighs the parallel speedup.
+_PARALLEL_MIN_RECORDS = 20000
+
+
+@functools.lru_cache(maxsize=None)
+def _pool_context():
+    """
+    Return the multiprocessing context used for the formatting pool.
+
+    Workers are started from a forkserver where available, since forking a
+    threaded gunicorn worker directly is not safe. Preloading this module means
+    each worker does not re-import Flask and the app before its first batch.
+    The context is set up on first use so importing the module has no side
+    effects when the pool is disabled.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("forkserver")
+    if __name__ != "__main__":
+        context.set_forkserver_preload([__name__])
+    return context
+
+
+def _available_cpus():
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _format_workers():
+    """
+    Return how many worker processes may format one export's batches.
+
+    Set by SQL_FORMAT_WORKERS and capped at the CPUs this process may run on.
+    It defaults to 1 (serial) because the CPU count seen here is the host's,
+    not the instance's CPU quota, and every pooled request pays for starting
+    fresh workers; enable it only where it has been measured to help.
+    """
+    try:
+        configured = int(os.environ.get("SQL_FORMAT_WORKERS", "1"))
+    except ValueError:
+        configured = 1
+    return max(1, min(configured, _available_cpus()))
+
 
-    generated_date = datetime.utcnow().strftime("%Y-%m-%d")
-    header = (
+# Rows per INSERT statement. Gains flatten out well before 1000 rows, while
+# larger statements get unwieldy in logs and risk statement-size limits.
+_DEFAULT_BATCH_SIZE = 500
+_MAX_BATCH_SIZE = 1000
+
+
+def _clamp_batch_size(batch_size):
+    """
+    Clamps a requested batch size to [1, _MAX_BATCH_SIZE], logging a warning
+    when the value had to be adjusted.
+
+    Args:
+        batch_size (int): The caller's requested rows per INSERT statement.
+
+    Returns:
+        int: A batch size within the supported range.
+    """
+    clamped = max(1, min(batch_size, _MAX_BATCH_SIZE))
+    if clamped != batch_size:
+        logger.warning(
+            "batch_size %s is outside [1, %s]; using %s", batch_size, _MAX_BATCH_SIZE, clamped
+        )
+    return clamped
+
+
+def _iter_batch_values(records, batch_size, mode_literal, format_rows=_format_rows):
+    """
+    Yields the formatted rows of each batch, in order.
+
+    Batches are independent, so when SQL_FORMAT_WORKERS allows it, large
+    exports are formatted in a process pool (sidestepping the GIL for the
+    pure-Python string work); everything else runs serially. At most one batch
+    per worker is in flight, so a slow reader holds back formatting instead of
+    letting finished batches pile up in memory.
+    """
+    starts = range(0, len(records), batch_size)
+    workers = min(_format_workers(), len(starts))
+    if len(records) < _PARALLEL_MIN_RECORDS or workers < 2:
+        for i in starts:
+            yield format_rows(records[i : i + batch_size], mode_literal)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+        pending = deque()
+        for i in starts:
+            pending.append(executor.submit(format_rows, records[i : i + batch_size], mode_literal))
+            if len(pending) == workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_sql(records, mode, batch_size=_DEFAULT_BATCH_SIZE, output_format="insert"):
+    """
+    Yields a SQL import script for CrashMap's crashdata table one piece at a time.
+
+    The header comment block is yielded first, then one piece per batch, so
+    callers can stream the script without holding all of it in memory. With
+    output_format="insert" each piece is a complete INSERT ... ON CONFLICT
+    statement. With output_format="copy" the script is a single
+    COPY ... FROM STDIN WITH (FORMAT csv) statement for psql, whose CSV rows
+    are streamed batch by batch; COPY has no ON CONFLICT, so it is meant for
+    loading into an empty or staging table.
+
+    Args:
+        records (list | RecordBatch): List of dicts parsed from the WSDOT API
+            response, or the same records stored column-wise.
+        mode (str): The transport mode stamped on every record ('Pedestrian', 'Bicyclist', etc.).
+        batch_size (int): Number of rows per INSERT statement (default 500,
+            clamped to 1-1000).
+        output_format (str): "insert" (default) or "copy".
+
+    Yields:
+        str: The header block, then each batched INSERT statement or block of COPY rows.
+
+    Raises:
+        ValueError: If output_format is not "insert" or "copy".
+    """
+    if output_format not in _OUTPUT_FORMATS:
+        raise ValueError(f"Unrecognized output format: {output_format!r}")
+
+    generated_date = _utc_today()
+    yield (
         f"-- CrashMap Data Import\n"
         f"-- Mode: {mode}\n"
         f"-- Generated: {generated_date}\n"
         f"-- Records: {len(records)}\n\n"
     )
 
-    parts = [header]
+    mode_literal = _sql_str(mode)
+    batch_size = _clamp_batch_size(batch_size)
 
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        values = ",\n".join(row_values(rec) for rec in batch)
-        stmt = (
-            f"INSERT INTO crashdata (\n{columns}\n) VALUES\n"
-            f"{values}\n"
-            f'ON CONFLICT ("ColliRptNum") DO NOTHING;\n'
-        )
-        parts.append(stmt)
-        if i + batch_size < len(records):
-            parts.append("\n")
+    if output_format == "copy":
+        yield _COPY_PREFIX
+        for values in _iter_batch_values(records, batch_size, mode_literal, _format_copy_rows):
+            yield values + "\n"
+        yield _COPY_SUFFIX
+        return
+
+    for n, values in enumerate(_iter_batch_values(records, batch_size, mode_literal)):
+        yield "".join(["\n" if n else "", _INSERT_PREFIX, values, _ON_CONFLICT_SUFFIX])
+
+
+def generate_sql(records, mode, batch_size=_DEFAULT_BATCH_SIZE, output_format="insert"):
+    """
+    Generates a SQL script for importing crash records into CrashMap's crashdata table.
 
-    return "".join(parts)
+    Args:
+        records (list | RecordBatch): List of dicts parsed from the WSDOT API
+            response, or the same records stored column-wise.
+        mode (str): The transport mode stamped on every record ('Pedestrian', 'Bicyclist', etc.).
+        batch_size (int): Number of rows per INSERT statement (default 500,
+            clamped to 1-1000).
+        output_format (str): "insert" (default) for batched
+            INSERT ... ON CONFLICT ("ColliRptNum") DO NOTHING statements, or
+            "copy" for a single COPY ... FROM STDIN WITH (FORMAT csv) block.
 
+    Returns:
+        str: The complete SQL script.
 
-if FLASK_AVAILABLE:
+    Raises:
+        ValueError: If output_format is not "insert" or "copy".
+    """
+    return "".join(iter_sql(records, mode, batch_size, output_format))
+
+
+# Map UI mode values to WSDOT rptName parameter values.
+# rptCategory is the same for both modes.
+_WSDOT_BASE_URL = (
+    "https://remoteapps.wsdot.wa.gov/highwaysafety/collision/data/portal/public/"
+    "CrashDataPortalService.svc/REST/GetPublicPortalData"
+)
+_WSDOT_RPT_NAME = {
+    "Pedestrian": "Pedestrians by Injury Type",
+    "Bicyclist":  "Bicyclists by Injury Type",
+}
+
+
+def create_app():
+    """
+    Builds the Flask application and registers its routes.
+
+    Returns:
+        Flask: The configured application.
+    """
     app = Flask(__name__)
-    
+
     # Enable CORS for all routes
-    try:
+    if CORS_AVAILABLE:
         CORS(app)
-    except:
-        # If CORS is not available, add basic CORS headers manually
+    else:
+        # If flask-cors is not installed, add basic CORS headers manually
         @app.after_request
         def after_request(response):
             response.headers.add('Access-Control-Allow-Origin', '*')
@@ -231,8 +793,13 @@ if FLASK_AVAILABLE:
 
             fixed_json = fix_malformed_json(malformed_json)
 
-            return jsonify(
-                {"fixed_json": fixed_json, "message": "JSON successfully formatted"}
+            # Encode the (possibly multi-MB) payload in one pass with the fast
+            # serializer rather than through jsonify
+            return Response(
+                _json_dumps(
+                    {"fixed_json": fixed_json, "message": "JSON successfully formatted"}
+                ),
+                mimetype="application/json",
             )
 
         except ValueError as e:
@@ -250,9 +817,11 @@ if FLASK_AVAILABLE:
           file        - .txt file containing the raw WSDOT API response (required)
           mode        - "Pedestrian" | "Bicyclist" | <other> (required)
           batch_size  - rows per INSERT statement (optional, default 500)
+          format      - "insert" | "copy" (optional, default "insert")
 
         Returns 200: Content-Disposition attachment — .sql file download
         Returns 400: { "error": "Missing required field: <field>" }
+        Returns 400: { "error": "Unrecognized format: ..." }
         Returns 500: { "error": "Failed to parse JSON: <message>" }
         """
         mode = request.form.get("mode", "").strip()
@@ -262,6 +831,12 @@ if FLASK_AVAILABLE:
         if "file" not in request.files or request.files["file"].filename == "":
             return jsonify({"error": "Missing required field: file"}), 400
 
+        output_format = request.form.get("format", "insert")
+        if isinstance(output_format, str):
+            output_format = output_format.strip().lower()
+        if output_format not in _OUTPUT_FORMATS:
+            return jsonify({"error": f"Unrecognized format: '{output_format}'. Must be 'insert' or 'copy'"}), 400
+
         try:
             batch_size = int(request.form.get("batch_size", 500))
         except (ValueError, TypeError):
@@ -274,39 +849,27 @@ if FLASK_AVAILABLE:
             return jsonify({"error": f"Failed to read file: {str(e)}"}), 400
 
         try:
-            fixed_json = fix_malformed_json(raw_content)
+            records = _parse_malformed(raw_content)
         except ValueError as e:
             return jsonify({"error": f"Failed to parse JSON: {str(e)}"}), 500
 
-        try:
-            records = json.loads(fixed_json)
-        except json.JSONDecodeError as e:
-            return jsonify({"error": f"Failed to parse JSON: {str(e)}"}), 500
-
-        if not isinstance(records, list):
+        # Checked up front: once the streamed response starts, a bad record can
+        # only truncate the download instead of returning this error.
+        if not isinstance(records, list) or not all(isinstance(rec, dict) for rec in records):
             return jsonify({"error": "Failed to parse JSON: expected a list of records"}), 500
 
-        sql = generate_sql(records, mode, batch_size)
-
-        date_str = datetime.utcnow().strftime("%Y%m%d")
-        filename = f"crashmap_import_{mode.lower()}_{date_str}.sql"
+        date_str = _utc_today().replace("-", "")
+        suffix = "_copy" if output_format == "copy" else ""
+        filename = f"crashmap_import_{mode.lower()}_{date_str}{suffix}.sql"
 
-        response = app.make_response(sql)
-        response.headers["Content-Type"] = "text/plain; charset=utf-8"
+        # Stream one batch at a time instead of building the whole script
+        response = Response(
+            iter_sql(records, mode, batch_size, output_format),
+            content_type="text/plain; charset=utf-8",
+        )
         response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
-    # Map UI mode values to WSDOT rptName parameter values.
-    # rptCategory is the same for both modes.
-    _WSDOT_BASE_URL = (
-        "https://remoteapps.wsdot.wa.gov/highwaysafety/collision/data/portal/public/"
-        "CrashDataPortalService.svc/REST/GetPublicPortalData"
-    )
-    _WSDOT_RPT_NAME = {
-        "Pedestrian": "Pedestrians by Injury Type",
-        "Bicyclist":  "Bicyclists by Injury Type",
-    }
-
     @app.route("/api/fetch-and-generate-sql", methods=["POST"])
     def fetch_and_generate_sql():
         """
@@ -317,10 +880,12 @@ if FLASK_AVAILABLE:
           start_date  - "YYYYMMDD" (required)
           end_date    - "YYYYMMDD" (required)
           batch_size  - rows per INSERT statement (optional, default 500)
+          format      - "insert" | "copy" (optional, default "insert")
 
         Returns 200: Content-Disposition attachment — .sql file download
         Returns 400: { "error": "Missing required field: <field>" }
         Returns 400: { "error": "Unrecognized mode: ..." }
+        Returns 400: { "error": "Unrecognized format: ..." }
         Returns 502: { "error": "WSDOT API request failed: <message>" }
         Returns 500: { "error": "Failed to parse JSON: <message>" }
         """
@@ -342,6 +907,12 @@ if FLASK_AVAILABLE:
         if rpt_name is None:
             return jsonify({"error": f"Unrecognized mode: '{mode}'. Must be 'Pedestrian' or 'Bicyclist'"}), 400
 
+        output_format = data.get("format") or "insert"
+        if isinstance(output_format, str):
+            output_format = output_format.strip().lower()
+        if output_format not in _OUTPUT_FORMATS:
+            return jsonify({"error": f"Unrecognized format: '{output_format}'. Must be 'insert' or 'copy'"}), 400
+
         try:
             batch_size = int(data.get("batch_size", 500))
         except (ValueError, TypeError):
@@ -364,28 +935,34 @@ if FLASK_AVAILABLE:
             return jsonify({"error": f"WSDOT API request failed: {str(e)}"}), 502
 
         try:
-            fixed_json = fix_malformed_json(wsdot_resp.text)
+            # Parse the raw body: JSON is UTF-8, and .text would first run
+            # requests' charset handling and decode the whole payload.
+            records = _parse_malformed(wsdot_resp.content)
         except ValueError as e:
             return jsonify({"error": f"Failed to parse JSON: {str(e)}"}), 500
 
-        try:
-            records = json.loads(fixed_json)
-        except json.JSONDecodeError as e:
-            return jsonify({"error": f"Failed to parse JSON: {str(e)}"}), 500
-
-        if not isinstance(records, list):
+        # Checked up front: once the streamed response starts, a bad record can
+        # only truncate the download instead of returning this error.
+        if not isinstance(records, list) or not all(isinstance(rec, dict) for rec in records):
             return jsonify({"error": "Failed to parse JSON: expected a list of records"}), 500
 
-        sql = generate_sql(records, mode, batch_size)
+        date_str = _utc_today().replace("-", "")
+        suffix = "_copy" if output_format == "copy" else ""
+        filename = f"crashmap_import_{mode.lower()}_{date_str}{suffix}.sql"
 
-        date_str = datetime.utcnow().strftime("%Y%m%d")
-        filename = f"crashmap_import_{mode.lower()}_{date_str}.sql"
-
-        response = app.make_response(sql)
-        response.headers["Content-Type"] = "text/plain; charset=utf-8"
+        # Stream one batch at a time instead of building the whole script
+        response = Response(
+            iter_sql(records, mode, batch_size, output_format),
+            content_type="text/plain; charset=utf-8",
+        )
         response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
+    return app
+
+
+app = create_app() if FLASK_AVAILABLE else None
+
 
 if __name__ == "__main__":
     if FLASK_AVAILABLE:
@@ -0,0 +1,24 @@
+"""Shared pytest fixtures for the backend test modules."""
+
+import json
+import os
+
+import pytest
+
+from app import fix_malformed_json
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "seattle short.txt")
+
+
+@pytest.fixture(scope="session")
+def sample_records():
+    """
+    The 7 sample WSDOT records, parsed through fix_malformed_json.
+
+    Read and parsed once per test session and shared by every test that asks
+    for it, so tests must not mutate the result.
+    """
+    # Read as bytes: the parser takes UTF-8 input directly, skipping a decode.
+    with open(SAMPLE_FILE, "rb") as f:
+        raw = f.read()
+    return json.loads(fix_malformed_json(raw))
@@ -2,18 +2,19 @@
 """End-to-end integration tests: live WSDOT API calls for both modes.
 
 These tests make real HTTP requests to the WSDOT collision API and validate
-the full pipeline: API fetch → fix_malformed_json → generate_sql.
+the full pipeline: API fetch → _parse_malformed → generate_sql.
 
 Run all e2e tests:
     pytest test_e2e.py -v
 
-Run directly:
+Run directly (delegates to pytest):
     python test_e2e.py
 """
 
-import json
+import functools
+import re
 import requests
-from app import fix_malformed_json, generate_sql
+from app import _parse_malformed, generate_sql
 
 # Narrow date window (one month) keeps response size small (~50–200 records/mode).
 START_DATE = "20250101"
@@ -36,6 +37,9 @@ _WSDOT_RPT_NAME = {
     "Bicyclist":  "Bicyclists by Injury Type",
 }
 
+# Captures the first value (ColliRptNum) of every VALUES tuple in generated SQL.
+_ROW_CRN_RE = re.compile(r"\(\s*'([^']*)'")
+
 # Keys every WSDOT record is expected to contain.
 EXPECTED_KEYS = {
     "ColliRptNum", "Jurisdiction", "RegionName", "CountyName",
@@ -44,13 +48,19 @@ EXPECTED_KEYS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def _fetch_records(mode):
-    """Fetch WSDOT data for *mode* and return the parsed list of record dicts."""
+    """
+    Fetch WSDOT data for *mode* and return the parsed list of record dicts.
+
+    The response is decoded once (no pretty-print and re-parse round trip), and
+    cached per mode so the tests below share one API call per mode. Callers
+    must not mutate the result.
+    """
     params = {**_WSDOT_PARAMS_BASE, "rptName": _WSDOT_RPT_NAME[mode]}
     resp = requests.get(_WSDOT_BASE_URL, params=params, timeout=60)
     resp.raise_for_status()
-    fixed = fix_malformed_json(resp.text)
-    return json.loads(fixed)
+    return _parse_malformed(resp.content)
 
 
 # ---------------------------------------------------------------------------
@@ -149,7 +159,8 @@ def test_e2e_pedestrian_all_collirptnums_present():
     """Every ColliRptNum from the Pedestrian API response appears in the SQL output."""
     records = _fetch_records("Pedestrian")
     sql = generate_sql(records, mode="Pedestrian")
-    missing = [r["ColliRptNum"] for r in records if f"'{r['ColliRptNum']}'" not in sql]
+    present = set(_ROW_CRN_RE.findall(sql))
+    missing = [r["ColliRptNum"] for r in records if r["ColliRptNum"] not in present]
     assert not missing, f"ColliRptNums missing from SQL: {missing[:5]}"
 
 
@@ -157,7 +168,8 @@ def test_e2e_bicyclist_all_collirptnums_present():
     """Every ColliRptNum from the Bicyclist API response appears in the SQL output."""
     records = _fetch_records("Bicyclist")
     sql = generate_sql(records, mode="Bicyclist")
-    missing = [r["ColliRptNum"] for r in records if f"'{r['ColliRptNum']}'" not in sql]
+    present = set(_ROW_CRN_RE.findall(sql))
+    missing = [r["ColliRptNum"] for r in records if r["ColliRptNum"] not in present]
     assert not missing, f"ColliRptNums missing from SQL: {missing[:5]}"
 
 
@@ -189,31 +201,6 @@ def test_e2e_bicyclist_crash_date_format():
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    tests = [
-        test_e2e_pedestrian_api_reachable,
-        test_e2e_bicyclist_api_reachable,
-        test_e2e_pedestrian_parse,
-        test_e2e_bicyclist_parse,
-        test_e2e_pedestrian_generate_sql,
-        test_e2e_bicyclist_generate_sql,
-        test_e2e_pedestrian_all_collirptnums_present,
-        test_e2e_bicyclist_all_collirptnums_present,
-        test_e2e_pedestrian_crash_date_format,
-        test_e2e_bicyclist_crash_date_format,
-    ]
-
-    passed = 0
-    failed = 0
-    for test_fn in tests:
-        try:
-            test_fn()
-            print(f"PASS  {test_fn.__name__}")
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL  {test_fn.__name__}: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR {test_fn.__name__}: {e}")
-            failed += 1
-
-    print(f"\n{passed} passed, {failed} failed")
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -4,79 +4,146 @@
 Run with pytest:
     pytest test_json_fixer.py -v
 
-Or directly:
+Or in parallel across cores (requires pytest-xdist, see requirements-dev.txt):
+    pytest -n auto test_json_fixer.py
+
+Or directly (delegates to pytest):
     python test_json_fixer.py
+
+The shared sample_records fixture lives in conftest.py.
 """
 
-import os
+import io
 import json
-from app import fix_malformed_json, generate_sql
+import math
+import re
+from collections import Counter
+
+import pytest
+
+import app
+from app import RecordBatch, fix_malformed_json, generate_sql
 
-SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "seattle short.txt")
+# Statement-level markers the SQL tests count, matched in a single pass.
+_INSERT = "INSERT INTO crashdata"
+_DO_NOTHING = 'ON CONFLICT ("ColliRptNum") DO NOTHING'
+_DO_UPDATE = "DO UPDATE"
+_SENTINELS = re.compile("|".join(map(re.escape, (_INSERT, _DO_NOTHING, _DO_UPDATE))))
 
 
-def _load_sample_records():
-    """Parse sample WSDOT data through fix_malformed_json and return as list of dicts."""
-    with open(SAMPLE_FILE, "r") as f:
-        raw = f.read()
-    return json.loads(fix_malformed_json(raw))
+def _sentinel_counts(sql):
+    """Count every INSERT / DO NOTHING / DO UPDATE marker in one scan of sql."""
+    return Counter(m.group() for m in _SENTINELS.finditer(sql))
 
 
 # ---------------------------------------------------------------------------
 # Existing fix_malformed_json tests
 # ---------------------------------------------------------------------------
 
-def test_json_fixer():
-    """Test the JSON fixer function with various malformed JSON examples"""
-
-    print("Testing JSON Fixer Function\n")
-
-    # Test 1: Double-encoded JSON (like the seattle.json case)
-    double_encoded = '"[{\\"ColliRptNum\\": \\"3838031\\", \\"Jurisdiction\\": \\"City Street\\", \\"CityName\\": \\"Seattle\\"}]"'
-    print("Test 1: Double-encoded JSON")
-    print("Input:", double_encoded)
-    try:
-        result = fix_malformed_json(double_encoded)
-        print("Output:")
-        print(result)
-        print()
-    except Exception as e:
-        print(f"Error: {e}\n")
-
-    # Test 2: Simple malformed JSON with extra escaping
-    malformed_simple = '{"name": "John", "city": "Seattle"}'
-    print("Test 2: Simple JSON (should work as-is)")
-    print("Input:", malformed_simple)
-    try:
-        result = fix_malformed_json(malformed_simple)
-        print("Output:")
-        print(result)
-        print()
-    except Exception as e:
-        print(f"Error: {e}\n")
-
-    # Test 3: JSON string that's been stringified
-    stringified_json = '"{\\"name\\": \\"Alice\\", \\"age\\": 30}"'
-    print("Test 3: Stringified JSON")
-    print("Input:", stringified_json)
-    try:
-        result = fix_malformed_json(stringified_json)
-        print("Output:")
-        print(result)
-        print()
-    except Exception as e:
-        print(f"Error: {e}\n")
-
-    print("Testing complete!")
+@pytest.mark.parametrize(
+    "payload, expected_key",
+    [
+        # Double-encoded JSON (like the seattle.json case)
+        ('"[{\\"ColliRptNum\\": \\"3838031\\", \\"Jurisdiction\\": \\"City Street\\", \\"CityName\\": \\"Seattle\\"}]"', "ColliRptNum"),
+        # Simple JSON (should work as-is)
+        ('{"name": "John", "city": "Seattle"}', "name"),
+        # JSON string that's been stringified
+        ('"{\\"name\\": \\"Alice\\", \\"age\\": 30}"', "name"),
+    ],
+    ids=["double_encoded", "simple", "stringified"],
+)
+def test_fix_variants(payload, expected_key):
+    """fix_malformed_json turns each malformed variant into parseable JSON."""
+    parsed = json.loads(fix_malformed_json(payload))
+    assert expected_key in (parsed[0] if isinstance(parsed, list) else parsed)
+
+
+def test_fix_malformed_json_repairs_invalid_wrapper():
+    """A quote-wrapped payload that is not a valid JSON string literal is repaired by hand."""
+    # Raw newline inside the outer quotes — invalid as a JSON string literal
+    wrapped = '"[{\\"ColliRptNum\\": \\"3838031\\",\n \\"CityName\\": \\"Seattle\\"}]"'
+    parsed = json.loads(fix_malformed_json(wrapped))
+    assert parsed == [{"ColliRptNum": "3838031", "CityName": "Seattle"}]
+
+
+def test_fix_malformed_json_repair_keeps_non_ascii():
+    """Hand-repaired layers keep non-ASCII text intact."""
+    wrapped = '"[{\\"CityName\\": \\"Coeur d\u2019Al\u00e8ne\\",\n \\"Note\\": \\"a\\\\\\"b\\"}]"'
+    parsed = json.loads(fix_malformed_json(wrapped))
+    assert parsed == [{"CityName": "Coeur d\u2019Al\u00e8ne", "Note": 'a"b'}]
+
+
+@pytest.mark.parametrize(
+    "escape, expected",
+    [("\\n", "a\nb"), ("\\t", "a\tb"), ("\\/", "a/b")],
+    ids=["newline", "tab", "solidus"],
+)
+def test_fix_malformed_json_repair_keeps_inner_escapes(escape, expected):
+    """Hand repair only unescapes \\" and \\\\; the inner JSON still decodes its own escapes."""
+    wrapped = '"[{\\"N\\": \\"a' + escape + 'b\\"},\n {}]"'
+    parsed = json.loads(fix_malformed_json(wrapped))
+    assert parsed == [{"N": expected}, {}]
+
+
+def test_fix_malformed_json_accepts_utf8_bytes():
+    """Raw UTF-8 bytes (e.g. an HTTP body) parse the same as the decoded string."""
+    for wrapped in (
+        '"[{\\"CityName\\": \\"Coeur d\u2019Al\u00e8ne\\"}]"',     # valid wrapper
+        '"[{\\"CityName\\": \\"Coeur d\u2019Al\u00e8ne\\"},\n {}]"',  # repaired by hand
+    ):
+        assert fix_malformed_json(wrapped.encode("utf-8")) == fix_malformed_json(wrapped)
+
+
+def test_fix_malformed_json_skips_cache_for_large_inputs():
+    """Inputs over the size limit are parsed without being pinned in the memo cache."""
+    large = "[" + "1," * app._FIX_CACHE_MAX_INPUT + "1]"
+    app._fix_malformed_json_cached.cache_clear()
+
+    assert json.loads(fix_malformed_json(large))[-1] == 1
+    assert app._fix_malformed_json_cached.cache_info().currsize == 0
+
+    fix_malformed_json("[1]")
+    assert app._fix_malformed_json_cached.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("value", [None, 5, ["[1]"]])
+def test_fix_malformed_json_rejects_non_text_input(value):
+    """Anything other than str or bytes is reported as a ValueError."""
+    with pytest.raises(ValueError, match="Error processing JSON"):
+        fix_malformed_json(value)
+
+
+def test_fix_malformed_json_keeps_large_integers_exact():
+    """Integers beyond 64 bits round-trip exactly instead of turning into floats."""
+    assert json.loads(fix_malformed_json('{"n": 18446744073709551616}')) == {"n": 2**64}
+    assert json.loads(fix_malformed_json('"[-9223372036854775809]"')) == [-(2**63) - 1]
+
+
+def test_fix_malformed_json_keeps_non_finite_numbers():
+    """NaN, Infinity and overflowing literals are written back as NaN and Infinity, not null."""
+    fixed = fix_malformed_json('"[NaN, -Infinity, 1e400, 1.5]"')
+
+    assert fixed == json.dumps([math.nan, -math.inf, math.inf, 1.5], indent=2)
+
+
+def test_fix_json_endpoint_accepts_lone_surrogate():
+    """Valid JSON holding a lone surrogate escape is returned, not rejected."""
+    if app.app is None:
+        pytest.skip("Flask is not installed")
+    client = app.app.test_client()
+    resp = client.post("/api/fix-json", json={"malformed_json": '["\\ud800"]'})
+
+    assert resp.status_code == 200
+    assert json.loads(resp.get_json()["fixed_json"]) == ["\ud800"]
 
 
 # ---------------------------------------------------------------------------
 # generate_sql tests
 # ---------------------------------------------------------------------------
 
-def test_generate_sql_basic_mapping():
+def test_generate_sql_basic_mapping(sample_records):
     """Output SQL maps WSDOT fields to CrashMap columns per the field mapping spec."""
-    records = _load_sample_records()
+    records = sample_records
     assert len(records) == 7, f"Expected 7 sample records, got {len(records)}"
 
     sql = generate_sql(records, mode="Bicyclist")
@@ -189,17 +256,39 @@ def test_generate_sql_null_coercion_age_group_empty():
     assert "''" not in sql
 
 
+def test_generate_sql_invalid_full_date_crash_date_null():
+    """A FullDate that is not an ISO date yields a NULL CrashDate; FullDate itself is kept."""
+    rec = {
+        "ColliRptNum": "D001",
+        "Jurisdiction": "City Street",
+        "RegionName": "Northwest",
+        "CountyName": "King",
+        "CityName": "Seattle",
+        "FullDate": "2025-02-30T00:00:00",   # no such day
+        "FullTime": "9:00 AM",
+        "MostSevereInjuryType": "No Injury",
+        "AgeGroup": "Adult",
+        "InvolvedPersons": 1,
+        "Latitude": 47.0,
+        "Longitude": -122.0,
+    }
+    sql = generate_sql([rec], mode="Pedestrian")
+
+    assert "'2025-02-30T00:00:00', NULL, '9:00 AM'" in sql
+    assert "'2025-02-30'" not in sql
+
+
 def test_generate_sql_string_escaping():
-    """Single quotes inside string values are doubled for SQL safety."""
+    """Single quotes are doubled and NULs dropped; backslashes pass through unchanged."""
     rec = {
         "ColliRptNum": "E001",
         "Jurisdiction": "State's Road",   # apostrophe in Jurisdiction
         "RegionName": "O'Brien Region",   # apostrophe in RegionName
-        "CountyName": "King",
+        "CountyName": "King\\County",      # backslash — literal under standard_conforming_strings
         "CityName": "O'Brien",            # apostrophe in CityName
         "FullDate": "2025-06-15T00:00:00",
         "FullTime": "3:00 PM",
-        "MostSevereInjuryType": "No Injury",
+        "MostSevereInjuryType": "No\x00 Injury",  # NUL — not storable in PostgreSQL text
         "AgeGroup": "Adult",
         "InvolvedPersons": 2,
         "Latitude": 48.0,
@@ -216,28 +305,277 @@ def test_generate_sql_string_escaping():
     assert "State's" not in sql
     assert "O'Brien'" not in sql or "'O''Brien'" in sql  # doubled form is present
 
+    assert "'King\\County'" in sql
+    assert "'No Injury'" in sql
+    assert "\x00" not in sql
 
-def test_generate_sql_batch_splitting():
+
+def test_generate_sql_numeric_coercion():
+    """Numeric columns accept numeric strings; NaN and non-numeric values become NULL."""
+    rec = {
+        "ColliRptNum": "N001",
+        "Jurisdiction": "City Street",
+        "RegionName": "Northwest",
+        "CountyName": "King",
+        "CityName": "Seattle",
+        "FullDate": "2025-04-01T00:00:00",
+        "FullTime": "8:00 AM",
+        "MostSevereInjuryType": "No Injury",
+        "AgeGroup": "Adult",
+        "InvolvedPersons": "2",                 # numeric string — emitted unquoted
+        "Latitude": float("nan"),               # non-finite — must become NULL
+        "Longitude": "-122.0); DROP TABLE x",   # not a number — must become NULL
+    }
+    sql = generate_sql([rec], mode="Pedestrian")
+
+    assert "'No Injury', 'Adult', 2, NULL, NULL, 'Pedestrian')" in sql
+    assert "nan" not in sql
+    assert "DROP TABLE" not in sql
+
+
+def test_generate_sql_unhashable_and_mixed_type_values():
+    """Unhashable field values don't crash the literal caches, and equal values of different types stay distinct."""
+    base = {
+        "ColliRptNum": "U001",
+        "Jurisdiction": "City Street",
+        "RegionName": "Northwest",
+        "CountyName": "King",
+        "CityName": "Seattle",
+        "FullDate": "2025-04-01T00:00:00",
+        "FullTime": "8:00 AM",
+        "MostSevereInjuryType": "No Injury",
+        "AgeGroup": "Adult",
+        "InvolvedPersons": 1,
+        "Latitude": 47.0,
+        "Longitude": -122.0,
+    }
+    records = [
+        {**base, "Jurisdiction": ["City", "Street"]},   # unhashable
+        {**base, "Jurisdiction": 1},
+        {**base, "Jurisdiction": 1.0},
+        {**base, "Jurisdiction": True},
+    ]
+    for output_format in ("insert", "copy"):
+        sql = generate_sql(records, mode="Pedestrian", output_format=output_format)
+        quote = '"' if output_format == "copy" else "'"
+        for text in ("['City', 'Street']", "1", "1.0", "True"):
+            expected = text.replace("'", "''") if output_format == "insert" else text
+            assert f"{quote}{expected}{quote}" in sql
+
+
+def test_generate_sql_batch_splitting(sample_records):
     """Records are split into multiple INSERT statements at the batch boundary."""
-    records = _load_sample_records()  # 7 records
+    records = sample_records  # 7 records
     sql = generate_sql(records, mode="Bicyclist", batch_size=3)
 
     # 7 records at batch_size=3 → batches of [3, 3, 1] → 3 INSERT statements
-    assert sql.count("INSERT INTO crashdata") == 3
-    assert sql.count('ON CONFLICT ("ColliRptNum") DO NOTHING') == 3
+    counts = _sentinel_counts(sql)
+    assert counts[_INSERT] == 3
+    assert counts[_DO_NOTHING] == 3
 
     # All 7 ColliRptNums must still appear
     for crn in ("3838031", "3887523", "3889408", "3898784", "3908245", "3919354", "3922496"):
         assert f"'{crn}'" in sql
 
 
-def test_generate_sql_single_batch():
+def test_generate_sql_single_batch(sample_records):
     """All records land in one INSERT when batch_size exceeds record count."""
-    records = _load_sample_records()  # 7 records
+    records = sample_records  # 7 records
     sql = generate_sql(records, mode="Pedestrian", batch_size=500)
 
-    assert sql.count("INSERT INTO crashdata") == 1
-    assert sql.count('ON CONFLICT ("ColliRptNum") DO NOTHING') == 1
+    counts = _sentinel_counts(sql)
+    assert counts[_INSERT] == 1
+    assert counts[_DO_NOTHING] == 1
+
+
+def test_generate_sql_oversize_batch_clamped():
+    """A batch_size above the 1000-row cap is clamped to 1000 rows per INSERT."""
+    rec = {
+        "ColliRptNum": "B001",
+        "Jurisdiction": "City Street",
+        "RegionName": "Northwest",
+        "CountyName": "King",
+        "CityName": "Seattle",
+        "FullDate": "2025-05-01T00:00:00",
+        "FullTime": "10:00 AM",
+        "MostSevereInjuryType": "No Injury",
+        "AgeGroup": "Adult",
+        "InvolvedPersons": 1,
+        "Latitude": 47.0,
+        "Longitude": -122.0,
+    }
+    records = [rec] * 2500
+    sql = generate_sql(records, mode="Pedestrian", batch_size=100000)
+
+    # 2500 records at the 1000-row cap → batches of [1000, 1000, 500]
+    assert _sentinel_counts(sql)[_INSERT] == math.ceil(len(records) / 1000)
+
+
+def test_generate_sql_multi_row_values():
+    """Each batch is one multi-row INSERT ... VALUES statement, not one INSERT per row."""
+    records = [
+        {
+            "ColliRptNum": f"M00{i}",
+            "Jurisdiction": "City Street",
+            "RegionName": "Northwest",
+            "CountyName": "King",
+            "CityName": "Seattle",
+            "FullDate": "2025-05-01T00:00:00",
+            "FullTime": "10:00 AM",
+            "MostSevereInjuryType": "No Injury",
+            "AgeGroup": "Adult",
+            "InvolvedPersons": 1,
+            "Latitude": 47.0,
+            "Longitude": -122.0,
+        }
+        for i in range(4)
+    ]
+    sql = generate_sql(records, mode="Pedestrian")
+
+    assert _sentinel_counts(sql)[_INSERT] == 1
+    assert sql.count(") VALUES\n") == 1
+    # Rows are comma-separated tuples under the single VALUES header
+    assert sql.count("),\n  (") == 3
+    assert sql.count(";") == 1
+
+
+def test_generate_sql_copy_mode():
+    """output_format="copy" emits one COPY ... FROM STDIN block of CSV rows with the same NULL rules."""
+    rec = {
+        "ColliRptNum": "C001",
+        "Jurisdiction": 'State\'s "Road"',  # apostrophe and double quote
+        "RegionName": "'",                  # WSDOT placeholder → NULL
+        "CountyName": "King",
+        "CityName": "Seattle",
+        "FullDate": "2025-06-15T00:00:00",
+        "FullTime": "3:00 PM",
+        "MostSevereInjuryType": "No Injury",
+        "AgeGroup": "",                     # empty → NULL
+        "InvolvedPersons": 2,
+        "Latitude": 48.0,
+        "Longitude": -121.0,
+    }
+    sql = generate_sql([rec] * 3, mode="Pedestrian", batch_size=2, output_format="copy")
+    lines = sql.splitlines()
+
+    assert sql.count("COPY crashdata (") == 1
+    assert ") FROM STDIN WITH (FORMAT csv);" in lines
+    assert lines[-1] == "\\."
+
+    rows = [line for line in lines if line.startswith('"C001"')]
+    assert len(rows) == 3
+    # NULLs are unquoted empty fields; strings are CSV-quoted with "" for embedded quotes
+    assert rows[0] == (
+        '"C001","State\'s ""Road""","Washington",,"King","Seattle",'
+        '"2025-06-15T00:00:00","2025-06-15","3:00 PM","No Injury",,2,48.0,-121.0,"Pedestrian"'
+    )
+
+    # COPY has no conflict clause
+    counts = _sentinel_counts(sql)
+    assert counts[_INSERT] == 0
+    assert counts[_DO_NOTHING] == 0
+
+
+def test_generate_sql_record_batch_matches_dicts():
+    """A column-wise RecordBatch produces the same script as the list of dicts it was built from."""
+    records = [
+        {
+            "ColliRptNum": f"R00{i}",
+            "Jurisdiction": "City Street",
+            "RegionName": "'" if i % 2 else "Northwest",
+            "CountyName": "King",
+            "CityName": "Seattle",
+            "FullDate": f"2025-05-0{i + 1}T00:00:00",
+            "FullTime": "10:00 AM",
+            "MostSevereInjuryType": "No Injury",
+            "AgeGroup": "" if i % 3 else "Adult",
+            "InvolvedPersons": i,
+            "Latitude": 47.0 + i,
+            "Longitude": -122.0,
+        }
+        for i in range(5)
+    ]
+    batch = RecordBatch.from_records(records)
+
+    assert len(batch) == 5
+    for output_format in ("insert", "copy"):
+        assert generate_sql(batch, mode="Bicyclist", batch_size=2, output_format=output_format) == (
+            generate_sql(records, mode="Bicyclist", batch_size=2, output_format=output_format)
+        )
+
+
+def test_generate_sql_pooled_matches_serial(monkeypatch):
+    """Formatting batches in the process pool yields the same script as serial formatting."""
+    records = [
+        {
+            "ColliRptNum": f"R{i:04d}",
+            "Jurisdiction": "City Street",
+            "RegionName": "O'Brien" if i % 2 else "Northwest",
+            "CountyName": "King",
+            "CityName": "Seattle",
+            "FullDate": f"2025-05-{i % 28 + 1:02d}T00:00:00",
+            "FullTime": "10:00 AM",
+            "MostSevereInjuryType": "No Injury",
+            "AgeGroup": "" if i % 3 else "Adult",
+            "InvolvedPersons": i,
+            "Latitude": 47.0 + i / 1000,
+            "Longitude": -122.0,
+        }
+        for i in range(50)
+    ]
+    batch = RecordBatch.from_records(records)
+
+    def scripts():
+        return [
+            generate_sql(source, mode="Bicyclist", batch_size=7, output_format=output_format)
+            for source in (records, batch)
+            for output_format in ("insert", "copy")
+        ]
+
+    serial = scripts()
+
+    pools = []
+
+    class RecordingPool(app.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs["max_workers"])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setenv("SQL_FORMAT_WORKERS", "2")
+    monkeypatch.setattr(app, "_available_cpus", lambda: 2)
+    monkeypatch.setattr(app, "_PARALLEL_MIN_RECORDS", 10)
+    monkeypatch.setattr(app, "ProcessPoolExecutor", RecordingPool)
+
+    assert scripts() == serial
+    assert pools == [2, 2, 2, 2]
+
+
+def test_generate_sql_endpoint_rejects_non_dict_records():
+    """A JSON list of non-records gets a JSON error before any SQL is streamed."""
+    if app.app is None:
+        pytest.skip("Flask is not installed")
+    client = app.app.test_client()
+    resp = client.post(
+        "/api/generate-sql",
+        data={"mode": "Pedestrian", "file": (io.BytesIO(b"[1, 2, 3]"), "bad.txt")},
+    )
+
+    assert resp.status_code == 500
+    assert resp.get_json() == {"error": "Failed to parse JSON: expected a list of records"}
+
+
+def test_fetch_endpoint_rejects_non_string_format():
+    """A non-string format gets the JSON 400 error rather than an unhandled exception."""
+    if app.app is None:
+        pytest.skip("Flask is not installed")
+    client = app.app.test_client()
+    resp = client.post(
+        "/api/fetch-and-generate-sql",
+        json={"mode": "Pedestrian", "start_date": "20250101", "end_date": "20250131", "format": 1},
+    )
+
+    assert resp.status_code == 400
+    assert resp.get_json()["error"].startswith("Unrecognized format")
 
 
 def test_generate_sql_duplicate_do_nothing():
@@ -262,8 +600,9 @@ def test_generate_sql_duplicate_do_nothing():
     assert sql.count("'DUP001'") == 2
 
     # Conflict resolution must be DO NOTHING — never DO UPDATE
-    assert 'ON CONFLICT ("ColliRptNum") DO NOTHING' in sql
-    assert "DO UPDATE" not in sql
+    counts = _sentinel_counts(sql)
+    assert counts[_DO_NOTHING] == 1
+    assert counts[_DO_UPDATE] == 0
 
 
 def test_generate_sql_cross_report_duplicate_do_nothing():
@@ -308,10 +647,9 @@ def test_generate_sql_cross_report_duplicate_do_nothing():
     assert f"'{known_crn}'" in bic_sql
 
     # Both must use DO NOTHING — never DO UPDATE
-    assert 'ON CONFLICT ("ColliRptNum") DO NOTHING' in ped_sql
-    assert 'ON CONFLICT ("ColliRptNum") DO NOTHING' in bic_sql
-    assert "DO UPDATE" not in ped_sql
-    assert "DO UPDATE" not in bic_sql
+    for counts in (_sentinel_counts(ped_sql), _sentinel_counts(bic_sql)):
+        assert counts[_DO_NOTHING] == 1
+        assert counts[_DO_UPDATE] == 0
 
     # Mode is stamped correctly and differs between the two batches
     assert "'Pedestrian'" in ped_sql
@@ -325,31 +663,4 @@ def test_generate_sql_cross_report_duplicate_do_nothing():
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    tests = [
-        test_json_fixer,
-        test_generate_sql_basic_mapping,
-        test_generate_sql_null_coercion_region_placeholder,
-        test_generate_sql_null_coercion_city_placeholder,
-        test_generate_sql_null_coercion_age_group_empty,
-        test_generate_sql_string_escaping,
-        test_generate_sql_batch_splitting,
-        test_generate_sql_single_batch,
-        test_generate_sql_duplicate_do_nothing,
-        test_generate_sql_cross_report_duplicate_do_nothing,
-    ]
-
-    passed = 0
-    failed = 0
-    for test_fn in tests:
-        try:
-            test_fn()
-            print(f"PASS  {test_fn.__name__}")
-            passed += 1
-        except AssertionError as e:
-            print(f"FAIL  {test_fn.__name__}: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"ERROR {test_fn.__name__}: {e}")
-            failed += 1
-
-    print(f"\n{passed} passed, {failed} failed")
+    raise SystemExit(pytest.main([__file__, "-v"]))
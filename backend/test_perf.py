@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Throughput benchmarks for generate_sql() in app.py (requires pytest-benchmark).
+
+The sample records are repeated to three sizes: the 7-record sample, 700
+records (two INSERT batches, 500 + 200, at the default batch_size), and 70,000
+records (above the multi-process threshold, so SQL_FORMAT_WORKERS > 1 also
+exercises the process pool).
+
+The tests carry the benchmark marker, which pytest.ini deselects by default,
+so a plain `pytest` run leaves them out. Run only the benchmarks:
+    pytest test_perf.py -m benchmark --benchmark-only
+
+Save a baseline, then fail if a later run's mean regresses by more than 20%:
+    pytest test_perf.py -m benchmark --benchmark-only --benchmark-autosave
+    pytest test_perf.py -m benchmark --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:20%
+"""
+
+import pytest
+
+from app import generate_sql
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("copies", [1, 100, 10000], ids=["small", "medium", "large"])
+def test_generate_sql_perf(benchmark, sample_records, copies):
+    """Time generate_sql over the sample records repeated `copies` times."""
+    records = sample_records * copies
+    sql = benchmark(generate_sql, records, mode="Bicyclist", batch_size=500)
+    assert f"-- Records: {len(records)}" in sql
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-m", "benchmark", "--benchmark-only", "-v"]))